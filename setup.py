@@ -13,6 +13,7 @@ setup(name='youtube-unofficial',
       'normal YouTube API access. Use at your own risk.',
       install_requires=('beautifulsoup4>=4.3.2', 'html5lib>=0.999',
                         'requests>=2.6.0'),
+      extras_require={'fast': ('lxml>=4.0.0', 'orjson>=3.0.0')},
       python_requires='~=3.6',
       entry_points={
           'console_scripts':
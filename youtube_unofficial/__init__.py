@@ -1,13 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http.cookiejar import CookieJar, LoadError, MozillaCookieJar
-from os.path import expanduser
-from time import sleep
-from typing import (Any, Dict, Iterator, Mapping, Optional, Sequence, Type,
-                    Union, cast)
+from os.path import expanduser, isfile
+from random import uniform
+from time import monotonic, sleep
+from typing import (Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple,
+                    Type, Union, cast)
 import hashlib
-import json
 import logging
 
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from typing_extensions import Final
 import requests
@@ -18,16 +20,45 @@ from .constants import (BROWSE_AJAX_URL, COMMUNITY_HISTORY_URL, HISTORY_URL,
                         WATCH_HISTORY_URL, WATCH_LATER_URL)
 from .download import DownloadMixin
 from .exceptions import AuthenticationError
-from .initial import initial_data
+from .initial import initial_data, initial_data_and_ytcfg
 from .login import YouTubeLogin
 from .typing.browse_ajax import BrowseAJAXSequence
 from .typing.playlist import PlaylistInfo, PlaylistVideoListRenderer
 from .typing.ytcfg import YtcfgDict
-from .util import context_client_body, path as at_path
+from .util import context_client_body, json_dumps, path as at_path
 from .ytcfg import find_ytcfg, ytcfg_headers
 
 __all__ = ('YouTube', )
 
+PAGE_CACHE_TTL: Final[float] = 60.0
+DELETION_BATCH_SIZE: Final[int] = 50
+DELETION_MAX_WORKERS: Final[int] = 8
+
+# Pre-parsed key tuples for the fixed-structure walks on the hot paths,
+# so path() skips both string parsing and per-step bytecode dispatch
+_CLEAR_HISTORY_SEJ_PATH: Final = ('contents',
+                                  'twoColumnBrowseResultsRenderer',
+                                  'secondaryContents',
+                                  'browseFeedActionsRenderer', 'contents', 2,
+                                  'buttonRenderer', 'navigationEndpoint',
+                                  'confirmDialogEndpoint', 'content',
+                                  'confirmDialogRenderer', 'confirmButton',
+                                  'buttonRenderer', 'serviceEndpoint')
+_PLAYLIST_VIDEO_LIST_RENDERER_PATH: Final = (
+    'contents', 'twoColumnBrowseResultsRenderer', 'tabs', 0, 'tabRenderer',
+    'content', 'sectionListRenderer', 'contents', 0, 'itemSectionRenderer',
+    'contents', 0, 'playlistVideoListRenderer')
+_SECTION_LIST_RENDERER_PATH: Final = ('contents',
+                                      'twoColumnBrowseResultsRenderer',
+                                      'tabs', 0, 'tabRenderer', 'content',
+                                      'sectionListRenderer')
+_CONTINUATION_ENDPOINT_PATH: Final = ('contents', -1,
+                                      'continuationItemRenderer',
+                                      'continuationEndpoint')
+_CONTINUATION_ITEMS_PATH: Final = ('onResponseReceivedActions', 0,
+                                   'appendContinuationItemsAction',
+                                   'continuationItems')
+
 
 class YouTube(DownloadMixin):
     def __init__(self,
@@ -48,6 +79,12 @@ class YouTube(DownloadMixin):
         self._log: Final[logging.Logger] = logging.getLogger(
             'youtube-unofficial')
         self._sess = requests.Session()
+        # Keep enough persistent connections alive for the deletion
+        # thread pool so parallel API calls skip TCP/TLS setup
+        self._sess.mount(
+            'https://',
+            HTTPAdapter(pool_connections=DELETION_MAX_WORKERS,
+                        pool_maxsize=DELETION_MAX_WORKERS))
         self._init_cookiejar(cookies_path, cls=cookiejar_cls)
         self._sess.cookies = self._cj  # type: ignore[assignment]
         self._sess.headers.update({'User-Agent': USER_AGENT})
@@ -55,7 +92,10 @@ class YouTube(DownloadMixin):
                                            self._cj,
                                            username,
                                            logged_in=logged_in)
-        self._rsvi_cache: Optional[Dict[str, Any]] = None
+        self._page_cache: Dict[str, Tuple[float, str, YtcfgDict,
+                                          Dict[str, str]]] = {}
+        self._sapisid: Optional[str] = None
+        self._sapisidhash: Optional[Tuple[int, str]] = None
 
     @property
     def logged_in(self):
@@ -66,17 +106,17 @@ class YouTube(DownloadMixin):
                         cls: Type[CookieJar] = MozillaCookieJar) -> None:
         self._log.debug('Initialising cookie jar (%s) at %s', cls.__name__,
                         path)
-        try:
-            with open(path):
-                pass
-        except IOError:
+        # One stat() instead of an open() to probe and another to create
+        just_created = not isfile(path)
+        if just_created:
             with open(path, 'w+'):
                 pass
         try:
             self._cj = cls(path)  # type: ignore[arg-type]
         except TypeError:
             self._cj = cls()
-        if hasattr(self._cj, 'load'):
+        # A freshly created file is empty, so there is nothing to parse
+        if not just_created and hasattr(self._cj, 'load'):
             try:
                 self._cj.load()  # type: ignore[attr-defined]
             except LoadError:
@@ -84,28 +124,36 @@ class YouTube(DownloadMixin):
 
     def login(self) -> None:
         self._login_handler.login()
+        # Cookies may have changed
+        self._sapisid = None
+        self._sapisidhash = None
+
+    def _cached_page_context(
+            self, url: str) -> Tuple[str, YtcfgDict, Dict[str, str]]:
+        """Fetch a page and extract its ytcfg and headers, reusing the
+        last fetch of the same URL for up to ``PAGE_CACHE_TTL`` seconds."""
+        cached = self._page_cache.get(url)
+        if cached and monotonic() - cached[0] < PAGE_CACHE_TTL:
+            return cached[1], cached[2], cached[3]
+        page = cast(str, self._download_page(url))
+        ytcfg = find_ytcfg(page)
+        headers = ytcfg_headers(ytcfg)
+        self._page_cache[url] = (monotonic(), page, ytcfg, headers)
+        return page, ytcfg, headers
 
     def remove_video_id_from_playlist(
             self,
             playlist_id: str,
             video_id: str,
             cache_values: Optional[bool] = False) -> None:
-        """Removes a video from a playlist."""
+        """Removes a video from a playlist.
+
+        ``cache_values`` is kept for backwards compatibility; page
+        fetches are always cached via ``_cached_page_context()``."""
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to login()'
                                       ' first')
-
-        if cache_values and self._rsvi_cache:
-            soup = self._rsvi_cache['soup']
-            ytcfg = self._rsvi_cache['ytcfg']
-            headers = self._rsvi_cache['headers']
-        else:
-            soup = self._download_page_soup(WATCH_LATER_URL)
-            ytcfg = find_ytcfg(soup)
-            headers = ytcfg_headers(ytcfg)
-        if cache_values:
-            self._rsvi_cache = dict(soup=soup, ytcfg=ytcfg, headers=headers)
-
+        ytcfg = self._cached_page_context(WATCH_LATER_URL)[1]
         action = {
             'removedVideoId': video_id,
             'action': 'ACTION_REMOVE_VIDEO_BY_VIDEO_ID'
@@ -155,20 +203,26 @@ class YouTube(DownloadMixin):
             playlist_id: str,
             set_video_id: str,
             cache_values: Optional[bool] = False):
-        """Removes a video from a playlist by setVideoId."""
+        """Removes a video from a playlist by setVideoId.
+
+        ``cache_values`` is kept for backwards compatibility; page
+        fetches are always cached via ``_cached_page_context()``."""
+        return self.remove_set_video_ids_from_playlist(
+            playlist_id, (set_video_id, ), cache_values)
+
+    def remove_set_video_ids_from_playlist(
+            self,
+            playlist_id: str,
+            set_video_ids: Sequence[str],
+            cache_values: Optional[bool] = False):
+        """Removes multiple videos from a playlist by setVideoId in a
+        single request."""
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to login()'
                                       ' first')
-        if cache_values and self._rsvi_cache:
-            soup = self._rsvi_cache['soup']
-            ytcfg = self._rsvi_cache['ytcfg']
-            headers = self._rsvi_cache['headers']
-        else:
-            soup = self._download_page_soup(WATCH_LATER_URL)
-            ytcfg = find_ytcfg(soup)
-            headers = ytcfg_headers(ytcfg)
-        if cache_values:
-            self._rsvi_cache = dict(soup=soup, ytcfg=ytcfg, headers=headers)
+        if not set_video_ids:
+            return True
+        ytcfg = self._cached_page_context(WATCH_LATER_URL)[1]
         assert 'INNERTUBE_API_KEY' in ytcfg
         assert 'VISITOR_DATA' in ytcfg
         assert 'DELEGATED_SESSION_ID' in ytcfg
@@ -202,7 +256,7 @@ class YouTube(DownloadMixin):
                         dict(
                             action='ACTION_REMOVE_VIDEO',
                             setVideoId=set_video_id,
-                        )
+                        ) for set_video_id in set_video_ids
                     ],
                               playlistId=playlist_id,
                               params='CAFAAQ%3D%3D',
@@ -219,23 +273,16 @@ class YouTube(DownloadMixin):
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
-        content = self._download_page_soup(HISTORY_URL)
-        ytcfg = find_ytcfg(content)
+        content = cast(str, self._download_page(HISTORY_URL))
+        init_data, ytcfg = initial_data_and_ytcfg(content)
         headers = ytcfg_headers(ytcfg)
         headers['x-spf-previous'] = HISTORY_URL
         headers['x-spf-referer'] = HISTORY_URL
-        init_data = initial_data(content)
         params = {'name': 'feedbackEndpoint'}
         try:
             data = {
                 'sej':
-                json.dumps(
-                    init_data['contents']['twoColumnBrowseResultsRenderer']
-                    ['secondaryContents']['browseFeedActionsRenderer']
-                    ['contents'][2]['buttonRenderer']['navigationEndpoint']
-                    ['confirmDialogEndpoint']['content']
-                    ['confirmDialogRenderer']['confirmButton']
-                    ['buttonRenderer']['serviceEndpoint']),
+                json_dumps(at_path(_CLEAR_HISTORY_SEJ_PATH, init_data)),
                 'csn':
                 ytcfg['EVENT_ID'],
                 'session_token':
@@ -258,18 +305,13 @@ class YouTube(DownloadMixin):
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
-        url = 'https://www.youtube.com/playlist?list={}'.format(playlist_id)
-        content = self._download_page_soup(url)
-        ytcfg = find_ytcfg(content)
-        headers = ytcfg_headers(ytcfg)
+        url = f'https://www.youtube.com/playlist?list={playlist_id}'
+        content, _, headers = self._cached_page_context(url)
         yt_init_data = initial_data(content)
         video_list_renderer: Optional[PlaylistVideoListRenderer] = None
         try:
-            video_list_renderer = (
-                yt_init_data['contents']['twoColumnBrowseResultsRenderer']
-                ['tabs'][0]['tabRenderer']['content']['sectionListRenderer']
-                ['contents'][0]['itemSectionRenderer']['contents'][0]
-                ['playlistVideoListRenderer'])
+            video_list_renderer = at_path(_PLAYLIST_VIDEO_LIST_RENDERER_PATH,
+                                          yt_init_data)
         except KeyError as e:
             if e.args[0] == 'playlistVideoListRenderer':
                 raise KeyError('This playlist might be empty.') from e
@@ -285,46 +327,64 @@ class YouTube(DownloadMixin):
             yield from []
         endpoint = continuation = itct = None
         try:
-            endpoint = (video_list_renderer['contents'][-1]
-                        ['continuationItemRenderer']['continuationEndpoint'])
+            endpoint = at_path(_CONTINUATION_ENDPOINT_PATH,
+                               video_list_renderer)
             continuation = endpoint['continuationCommand']['token']
             itct = endpoint['clickTrackingParams']
         except KeyError:
             pass
-        if continuation and itct:
+        if not continuation or not itct:
+            return
+
+        def fetch(ctoken: str, click_params: str) -> BrowseAJAXSequence:
+            return cast(
+                BrowseAJAXSequence,
+                self._download_page(BROWSE_AJAX_URL,
+                                    params={
+                                        'ctoken': ctoken,
+                                        'continuation': ctoken,
+                                        'itct': click_params
+                                    },
+                                    return_json=True,
+                                    headers=headers))
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(fetch, continuation, itct)
             while True:
-                params = {
-                    'ctoken': continuation,
-                    'continuation': continuation,
-                    'itct': itct
-                }
-                contents = cast(
-                    BrowseAJAXSequence,
-                    self._download_page(BROWSE_AJAX_URL,
-                                        params=params,
-                                        return_json=True,
-                                        headers=headers))
+                contents = future.result()
                 response = contents[1]['response']
                 assert 'onResponseReceivedActions' in response
-                items = (
-                    response['onResponseReceivedActions'][0]
-                    ['appendContinuationItemsAction']['continuationItems'])
+                items = at_path(_CONTINUATION_ITEMS_PATH, response)
+                has_more = 'continuationItemRenderer' in items[-1]
+                if has_more:
+                    try:
+                        endpoint = (items[-1]['continuationItemRenderer']
+                                    ['continuationEndpoint'])
+                        next_token = endpoint['continuationCommand']['token']
+                        itct = endpoint['clickTrackingParams']
+                    except KeyError:
+                        has_more = False
+                    else:
+                        if next_token == continuation:
+                            # A token that does not advance would loop
+                            # over the same page forever
+                            has_more = False
+                        else:
+                            continuation = next_token
+                            # Download the next page while the caller
+                            # processes this one
+                            future = executor.submit(fetch, continuation,
+                                                     itct)
                 for item in items:
                     if 'playlistVideoRenderer' in item:
                         yield item
                     elif 'continuationItemRenderer' in item:
-                        try:
-                            endpoint = (video_list_renderer['contents'][-1]
-                                        ['continuationItemRenderer']
-                                        ['continuationEndpoint'])
-                            continuation = endpoint['continuationCommand'][
-                                'token']
-                            itct = endpoint['clickTrackingParams']
-                        except KeyError:
-                            pass
                         break
-                if 'continuationItemRenderer' not in items[-1]:
+                if not has_more:
                     break
+        finally:
+            executor.shutdown(wait=False)
 
     def clear_playlist(self, playlist_id: str) -> None:
         """
@@ -335,18 +395,39 @@ class YouTube(DownloadMixin):
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
         playlist_info = self.get_playlist_info(playlist_id)
+        set_video_ids = []
+        video_ids = []
         try:
-            video_ids = list(
-                map(lambda x: x['playlistVideoRenderer']['videoId'],
-                    playlist_info))
+            for item in playlist_info:
+                renderer = item['playlistVideoRenderer']
+                if 'setVideoId' in renderer:
+                    set_video_ids.append(renderer['setVideoId'])
+                else:
+                    video_ids.append(renderer['videoId'])
         except KeyError:
             self._log.info('Caught KeyError. This probably means the playlist '
                            'is empty.')
             return
-        for video_id in video_ids:
+        for index in range(0, len(set_video_ids), DELETION_BATCH_SIZE):
+            batch = set_video_ids[index:index + DELETION_BATCH_SIZE]
+            self._log.debug('Deleting %d videos from playlist in one request',
+                            len(batch))
+            self.remove_set_video_ids_from_playlist(playlist_id, batch)
+        if not video_ids:
+            return
+
+        def remove(video_id: str) -> None:
+            # Small jitter so the workers do not fire in lockstep
+            sleep(uniform(0, 0.5))
             self._log.debug('Deleting from playlist: video_id = %s', video_id)
             self.remove_video_id_from_playlist(playlist_id, video_id)
 
+        # Warm the page cache once so the workers do not all fetch the
+        # Watch Later page. requests.Session is thread-safe for dispatch.
+        self._cached_page_context(WATCH_LATER_URL)
+        with ThreadPoolExecutor(max_workers=DELETION_MAX_WORKERS) as executor:
+            list(executor.map(remove, video_ids))
+
     def clear_watch_later(self) -> None:
         """Removes all videos from the 'Watch Later' playlist."""
         self.clear_playlist('WL')
@@ -356,12 +437,9 @@ class YouTube(DownloadMixin):
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
-        content = self._download_page_soup(HISTORY_URL)
-        init_data = initial_data(content)
-        ytcfg = find_ytcfg(content)
-        section_list_renderer = (
-            init_data['contents']['twoColumnBrowseResultsRenderer']['tabs'][0]
-            ['tabRenderer']['content']['sectionListRenderer'])
+        content = cast(str, self._download_page(HISTORY_URL))
+        init_data, ytcfg = initial_data_and_ytcfg(content)
+        section_list_renderer = at_path(_SECTION_LIST_RENDERER_PATH, init_data)
         next_continuation = None
         for section_list in section_list_renderer['contents']:
             try:
@@ -386,44 +464,25 @@ class YouTube(DownloadMixin):
         params = dict(continuation=next_continuation['continuation'],
                       ctoken=next_continuation['continuation'],
                       itct=next_continuation['clickTrackingParams'])
-        resp = None
-        while True:
-            tries = 0
-            time = 0
-            last_exception = None
-            while tries < 5:
-                if time:
-                    sleep(time)
-                try:
-                    resp = self._single_feedback_api_call(
-                        ytcfg,
-                        api_url='/youtubei/v1/browse',
-                        merge_json=dict(continuation=params['continuation']),
-                        return_is_processed=False)
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self._browse_continuation, ytcfg,
+                                     params['continuation'])
+            while True:
+                contents = future.result()
+                if contents is None:
                     break
-                except HTTPError as e:
-                    last_exception = e
-                    tries += 1
-                    time = 2**tries
-            if last_exception:
-                self._log.debug('Caught HTTP error: %s, text: %s',
-                                last_exception, last_exception.response.text)
-                break
-            assert resp is not None
-            contents = cast(Mapping[str, Any], resp)
-            try:
-                section_list_renderer = (
-                    contents['onResponseReceivedActions'][0]
-                    ['appendContinuationItemsAction']['continuationItems'])
-            except KeyError as e:
-                self._log.debug('Caught KeyError: %s. Possible keys: %s', e,
-                                ', '.join(contents.keys()))
-                break
-            continuations = None
-            for section_list in section_list_renderer:
                 try:
-                    yield from section_list['itemSectionRenderer']['contents']
+                    section_list_renderer = at_path(_CONTINUATION_ITEMS_PATH,
+                                                    contents)
                 except KeyError as e:
+                    self._log.debug('Caught KeyError: %s. Possible keys: %s',
+                                    e, ', '.join(contents.keys()))
+                    break
+                # Find the next continuation up front so the next page
+                # downloads while the caller processes this one
+                continuations = None
+                for section_list in section_list_renderer:
                     if 'continuationItemRenderer' in section_list:
                         continuations = [
                             dict(nextContinuationData=dict(
@@ -437,26 +496,42 @@ class YouTube(DownloadMixin):
                                     ['clickTrackingParams'])))
                         ]
                         break
-                    raise e
-            if not continuations:
-                try:
-                    continuations = section_list_renderer['continuations']
-                except KeyError as e:
-                    # Probably the end of the history
-                    self._log.debug('Caught KeyError: %s. Possible keys: %s',
-                                    e, ', '.join(section_list_renderer.keys()))
-                    break
-                except TypeError as e:
-                    # Probably the end of the history
-                    self._log.debug(
-                        'Caught TypeError evaluating '
-                        '"section_list_renderer[\'continuations\']": %s', e)
+                if not continuations:
+                    try:
+                        continuations = section_list_renderer['continuations']
+                    except KeyError as e:
+                        # Probably the end of the history
+                        self._log.debug(
+                            'Caught KeyError: %s. Possible keys: %s', e,
+                            ', '.join(section_list_renderer.keys()))
+                        continuations = None
+                    except TypeError as e:
+                        # Probably the end of the history
+                        self._log.debug(
+                            'Caught TypeError evaluating '
+                            '"section_list_renderer[\'continuations\']": %s',
+                            e)
+                        continuations = None
+                future = None
+                if continuations:
+                    next_cont = continuations[0]['nextContinuationData']
+                    params['itct'] = next_cont['clickTrackingParams']
+                    params['ctoken'] = next_cont['continuation']
+                    params['continuation'] = next_cont['continuation']
+                    future = executor.submit(self._browse_continuation, ytcfg,
+                                             params['continuation'])
+                for section_list in section_list_renderer:
+                    try:
+                        yield from section_list['itemSectionRenderer'][
+                            'contents']
+                    except KeyError as e:
+                        if 'continuationItemRenderer' in section_list:
+                            break
+                        raise e
+                if future is None:
                     break
-            assert continuations is not None
-            next_cont = continuations[0]['nextContinuationData']
-            params['itct'] = next_cont['clickTrackingParams']
-            params['ctoken'] = next_cont['continuation']
-            params['continuation'] = next_cont['continuation']
+        finally:
+            executor.shutdown(wait=False)
 
     def remove_video_ids_from_history(self, video_ids: Sequence[str]) -> bool:
         """Delete a history entry by video ID."""
@@ -466,8 +541,7 @@ class YouTube(DownloadMixin):
         if not video_ids:
             return False
         history_info = self.get_history_info()
-        content = self._download_page_soup(HISTORY_URL)
-        ytcfg = find_ytcfg(content)
+        ytcfg = self._cached_page_context(HISTORY_URL)[1]
         entries = [
             x for x in history_info
             if x['videoRenderer']['videoId'] in video_ids
@@ -488,15 +562,19 @@ class YouTube(DownloadMixin):
 
     def _authorization_sapisidhash_header(self) -> str:
         now = int(datetime.now().timestamp())
-        sapisid: Optional[str] = None
-        for cookie in self._cj:
-            if cookie.name in ('SAPISID', '__Secure-3PAPISID'):
-                sapisid = cookie.value
-                break
-        assert sapisid is not None
+        if self._sapisidhash and self._sapisidhash[0] == now:
+            return self._sapisidhash[1]
+        if self._sapisid is None:
+            for cookie in self._cj:
+                if cookie.name in ('SAPISID', '__Secure-3PAPISID'):
+                    self._sapisid = cookie.value
+                    break
+        assert self._sapisid is not None
         m = hashlib.sha1()
-        m.update(f'{now} {sapisid} https://www.youtube.com'.encode())
-        return f'SAPISIDHASH {now}_{m.hexdigest()}'
+        m.update(f'{now} {self._sapisid} https://www.youtube.com'.encode())
+        header = f'SAPISIDHASH {now}_{m.hexdigest()}'
+        self._sapisidhash = (now, header)
+        return header
 
     def _single_feedback_api_call(
             self,
@@ -540,17 +618,40 @@ class YouTube(DownloadMixin):
                 return False
         return ret
 
+    def _browse_continuation(
+            self, ytcfg: YtcfgDict,
+            continuation: str) -> Optional[Mapping[str, Any]]:
+        """Fetch one browse continuation with exponential backoff,
+        returning ``None`` once the retries are exhausted."""
+        tries = 0
+        while tries < 5:
+            if tries:
+                sleep(2**tries)
+            try:
+                return cast(
+                    Mapping[str, Any],
+                    self._single_feedback_api_call(
+                        ytcfg,
+                        api_url='/youtubei/v1/browse',
+                        merge_json=dict(continuation=continuation),
+                        return_is_processed=False))
+            except HTTPError as e:
+                self._log.debug('Caught HTTP error: %s, text: %s', e,
+                                e.response.text)
+                tries += 1
+        return None
+
     def _toggle_history(self, page_url: str, contents_index: int) -> bool:
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
-        content = self._download_page_soup(page_url)
-        ytcfg = find_ytcfg(content)
+        content = cast(str, self._download_page(page_url))
+        init_data, ytcfg = initial_data_and_ytcfg(content)
         info = at_path(('contents.twoColumnBrowseResultsRenderer.'
                         'secondaryContents.browseFeedActionsRenderer.contents.'
                         f'{contents_index}.buttonRenderer.navigationEndpoint.'
                         'confirmDialogEndpoint.content.confirmDialogRenderer.'
-                        'confirmEndpoint'), initial_data(content))
+                        'confirmEndpoint'), init_data)
         return cast(
             bool,
             self._single_feedback_api_call(
@@ -572,15 +673,15 @@ class YouTube(DownloadMixin):
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
-        content = self._download_page_soup(COMMUNITY_HISTORY_URL)
-        ytcfg = find_ytcfg(content)
+        content = cast(str, self._download_page(COMMUNITY_HISTORY_URL))
+        init_data, ytcfg = initial_data_and_ytcfg(content)
         headers = ytcfg_headers(ytcfg)
         headers['x-spf-previous'] = COMMUNITY_HISTORY_URL
         headers['x-spf-referer'] = COMMUNITY_HISTORY_URL
         item_section = at_path(
             ('contents.twoColumnBrowseResultsRenderer.tabs.'
              '0.tabRenderer.content.sectionListRenderer.contents.0.'
-             'itemSectionRenderer'), initial_data(content))
+             'itemSectionRenderer'), init_data)
         info = item_section['contents']
         delete_action_path = (
             'actionMenu.menuRenderer.items.0.menuNavigationItemRenderer.'
@@ -634,8 +735,7 @@ class YouTube(DownloadMixin):
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
         if not ytcfg:
-            content = self._download_page_soup(COMMUNITY_HISTORY_URL)
-            ytcfg = find_ytcfg(content)
+            ytcfg = self._cached_page_context(COMMUNITY_HISTORY_URL)[1]
         assert 'INNERTUBE_API_KEY' in ytcfg
         assert 'DELEGATED_SESSION_ID' in ytcfg
         return (at_path(
@@ -670,15 +770,16 @@ class YouTube(DownloadMixin):
         if not self.logged_in:
             raise AuthenticationError('This method requires a call to '
                                       'login() first')
-        content = self._download_page_soup(SEARCH_HISTORY_URL)
+        content = cast(str, self._download_page(SEARCH_HISTORY_URL))
+        init_data, ytcfg = initial_data_and_ytcfg(content)
         return cast(
             bool,
             self._single_feedback_api_call(
-                find_ytcfg(content),
+                ytcfg,
                 at_path(
                     'contents.twoColumnBrowseResultsRenderer.'
                     'secondaryContents.browseFeedActionsRenderer.'
                     'contents.1.buttonRenderer.navigationEndpoint.'
                     'confirmDialogEndpoint.content.confirmDialogRenderer.'
                     'confirmEndpoint.feedbackEndpoint.feedbackToken',
-                    initial_data(content))))
+                    init_data)))
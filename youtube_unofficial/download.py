@@ -4,6 +4,17 @@ from bs4 import BeautifulSoup as Soup
 from requests import Request, Session
 from typing_extensions import Literal
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import lxml  # noqa: F401 pylint: disable=unused-import
+    DEFAULT_PARSER = 'lxml'
+except ImportError:  # pragma: no cover
+    DEFAULT_PARSER = 'html5lib'
+
 __all__ = ('DownloadMixin', 'download_page')
 
 
@@ -16,15 +27,29 @@ def download_page(
         params: Optional[Mapping[str, str]] = None,
         return_json: bool = False,
         json: Any = None) -> Union[str, Sequence[Any], Mapping[str, Any]]:
-    if headers:
-        sess.headers.update(headers)
-    req = Request(method.upper(), url, data=data, params=params, json=json)
+    # Headers are request-scoped (merged with the session's during
+    # prepare_request) rather than written to sess.headers, which is
+    # shared with concurrent requests from the worker/prefetch threads
+    req = Request(method.upper(),
+                  url,
+                  data=data,
+                  headers=headers,
+                  params=params,
+                  json=json)
     prepped = sess.prepare_request(req)  # type: ignore[no-untyped-call]
     del prepped.headers['accept-encoding']
     r = sess.send(prepped)  # type: ignore[no-untyped-call]
     r.raise_for_status()
     if not return_json:
+        if r.encoding is None:
+            # Skip the chardet/charset detection pass over the whole
+            # body; YouTube always serves UTF-8
+            r.encoding = 'utf-8'
         return r.text.strip()
+    if orjson is not None:
+        # orjson parses the large playlist/history AJAX payloads several
+        # times faster than the stdlib decoder used by Response.json()
+        return cast(Mapping[str, Any], orjson.loads(r.content))
     return cast(Mapping[str, Any], r.json())
 
 
@@ -44,5 +69,5 @@ class DownloadMixin:  # pylint: disable=too-few-public-methods
                              return_json, json)
 
     def _download_page_soup(self, *args: Any, **kwargs: Any) -> Soup:
-        return Soup(cast(str, self._download_page(*args, **kwargs)),
-                    kwargs.pop('parser', 'html5lib'))
+        parser = kwargs.pop('parser', DEFAULT_PARSER)
+        return Soup(cast(str, self._download_page(*args, **kwargs)), parser)
@@ -44,9 +44,8 @@ def download_history() -> int:
     makedirs(args.output_dir[0], exist_ok=True)
     chdir(args.output_dir[0])
     for item in yt.get_history_info():
-        print('{}: {}'.format(
-            item['videoRenderer']['videoId'],
-            item['videoRenderer']['title']['runs'][0]['text']))
+        print(f"{item['videoRenderer']['videoId']}: "
+              f"{item['videoRenderer']['title']['runs'][0]['text']}")
         call_youtube_dl(args.youtube_dl[0], item['videoRenderer']['videoId'],
                         ytdl_args[1:])
         if args.delete_after:
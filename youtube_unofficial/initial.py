@@ -1,21 +1,66 @@
-from typing import Any, Mapping, cast
+from typing import Any, Mapping, Optional, Tuple, Union, cast
 import json
 import re
 
 from bs4 import BeautifulSoup as Soup
 
+from .typing.ytcfg import YtcfgDict
 from .util import first
+from .ytcfg import YTCFG_MARKER, find_ytcfg_in_html, parse_ytcfg
 
 YT_INITIAL_DATA_RE = r'^var ytInitialData(?:\s+)?='
+_YT_INITIAL_DATA_RE = re.compile(YT_INITIAL_DATA_RE)
+_INITIAL_DATA_MARKER = 'var ytInitialData'
 
 
-def initial_data(content: Soup) -> Mapping[str, Any]:
+def _parse_initial_data(script_text: str) -> Mapping[str, Any]:
     return cast(
         Mapping[str, Any],
         json.loads(
-            first(
-                re.sub(
-                    YT_INITIAL_DATA_RE, '',
-                    first(x.text.strip() for x in content.select('script')
-                          if re.match(YT_INITIAL_DATA_RE,
-                                      x.text.strip()))).split('\n'))[:-1]))
+            first(_YT_INITIAL_DATA_RE.sub('', script_text).split('\n'))[:-1]))
+
+
+def _find_initial_data_in_html(html: str) -> Mapping[str, Any]:
+    """Find the ytInitialData JSON in raw page text without building a
+    DOM."""
+    index = html.find(_INITIAL_DATA_MARKER)
+    if index == -1:
+        raise IndexError(0)
+    return cast(
+        Mapping[str, Any],
+        json.JSONDecoder().raw_decode(html, html.index('{', index))[0])
+
+
+def initial_data(content: Union[str, Soup]) -> Mapping[str, Any]:
+    if isinstance(content, str):
+        return _find_initial_data_in_html(content)
+    return _parse_initial_data(
+        first(x.text.strip() for x in content.select('script')
+              if _YT_INITIAL_DATA_RE.match(x.text.strip())))
+
+
+def initial_data_and_ytcfg(
+        content: Union[str, Soup]) -> Tuple[Mapping[str, Any], YtcfgDict]:
+    """Extract ytInitialData and the ytcfg in a single pass over the
+    page's ``<script>`` tags."""
+    if isinstance(content, str):
+        return (_find_initial_data_in_html(content),
+                find_ytcfg_in_html(content))
+    init_data: Optional[Mapping[str, Any]] = None
+    ytcfg: Optional[YtcfgDict] = None
+    for script in content.select('script'):
+        text = script.text
+        if init_data is None:
+            stripped = text.strip()
+            if _YT_INITIAL_DATA_RE.match(stripped):
+                init_data = _parse_initial_data(stripped)
+                if ytcfg is not None:
+                    break
+                continue
+        if ytcfg is None and YTCFG_MARKER in text:
+            ytcfg = parse_ytcfg(text)
+            if init_data is not None:
+                break
+    if init_data is None or ytcfg is None:
+        raise IndexError(0)
+    return init_data, ytcfg
@@ -56,7 +56,7 @@ class YouTubeLogin(DownloadMixin):
             self._log.debug('Using default two-factor callback')
             tfa_code_callback = _stdin_tfa_code_callback
         # Check if already logged in with cookies
-        content = self._download_page_soup('https://www.youtube.com/')
+        content = cast(str, self._download_page('https://www.youtube.com/'))
         ytcfg = find_ytcfg(content)
         if ytcfg['LOGGED_IN']:
             self._log.debug('Already logged in via cookies')
@@ -51,6 +51,7 @@ class PlaylistVideoRendererMenuDict(TypedDict):
 
 class PlaylistVideoRendererDict(TypedDict, total=False):
     navigationEndpoint: NavigationEndpointDict
+    setVideoId: str
     shortBylineText: RunsOrTextDict
     title: RunsOrSimpleTextDict
     videoId: str
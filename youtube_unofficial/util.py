@@ -1,19 +1,33 @@
+from functools import reduce
+from html import unescape
 from html.parser import HTMLParser
+from operator import getitem, itemgetter
 from typing import (Any, Callable, Dict, Iterable, Mapping, Optional, Sequence,
-                    Type, TypeVar, Union)
+                    Tuple, Type, TypeVar, Union, cast)
+import json
 import random
 import re
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from .constants import USER_AGENT
 from .typing.history import DescriptionSnippetDict
 from .typing.ytcfg import CountryLocationInfoDict, YtcfgDict
 
 __all__ = ('assert_not_none', 'context_client_body', 'extract_attributes',
-           'extract_keys', 'get_text_runs', 'html_hidden_inputs', 'path',
-           'path_default', 'remove_start', 'try_get')
+           'extract_keys', 'get_text_runs', 'html_hidden_inputs', 'json_dumps',
+           'path', 'path_default', 'remove_start', 'try_get')
 
 T = TypeVar('T')
 
+_TAG_OPEN_RE = re.compile(r'<\s*[A-Za-z][^\s/>]*')
+_ATTR_RE = re.compile(
+    r'''([\w:-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]*)))?''')
+_INPUT_RE = re.compile(r'(?i)<input\b[^>]*>')
+
 
 class HTMLAttributeParser(HTMLParser):  # pylint: disable=abstract-method
     """Trivial HTML parser to gather the attributes for a single element"""
@@ -41,6 +55,24 @@ def extract_attributes(html_element: str) -> Mapping[str, str]:
     NB HTMLParser is stricter in Python 2.6 & 3.2 than in later versions,
     but the cases in the unit test will work for all of 2.6, 2.7, 3.2-3.5.
     """
+    # Fast path: the inputs here are well-formed single elements, so a
+    # precompiled attribute regex avoids instantiating a full HTMLParser
+    # state machine per call
+    m = _TAG_OPEN_RE.search(html_element)
+    if m:
+        attrs: Dict[str, Optional[str]] = {}
+        for attr in _ATTR_RE.finditer(html_element, m.end()):
+            value: Optional[str]
+            if attr.group(2) is not None:
+                value = attr.group(2)
+            elif attr.group(3) is not None:
+                value = attr.group(3)
+            else:
+                value = attr.group(4)
+            if value is not None and '&' in value:
+                value = unescape(value)
+            attrs[attr.group(1).lower()] = value
+        return cast(Mapping[str, str], attrs)
     parser = HTMLAttributeParser()
     parser.feed(html_element)
     parser.close()
@@ -50,10 +82,10 @@ def extract_attributes(html_element: str) -> Mapping[str, str]:
 def try_get(src: Any,
             getter: Union[Sequence[Callable[..., Any]], Callable[..., Any]],
             expected_type: Optional[Type[Any]] = None) -> Any:
-    if not isinstance(getter, (list, tuple)):
-        getter = [getter]  # type: ignore[list-item]
-    assert isinstance(getter, list)
-    for get in getter:
+    # Most callers pass a single callable; a tuple literal avoids
+    # allocating a one-element list per call
+    getters = getter if isinstance(getter, (list, tuple)) else (getter, )
+    for get in getters:
         try:
             v = get(src)
         except (AttributeError, KeyError, TypeError, IndexError):
@@ -68,12 +100,14 @@ def remove_start(s: Optional[str], start: str) -> Optional[str]:
 
 
 def html_hidden_inputs(html: str) -> Dict[str, str]:
-    html_ = re.sub(r'<!--(?:(?!<!--).)*-->', '', html)
     hidden_inputs: Dict[str, str] = dict()
-    for input in re.findall(r'(?i)(<input[^>]+>)', html_):
-        attrs = extract_attributes(input)
-        if not input:
+    for m in _INPUT_RE.finditer(html):
+        # An unclosed '<!--' before the match means the input is inside a
+        # comment. Checking this per match avoids the comment-stripping
+        # re.sub() that copied the whole page
+        if html.rfind('<!--', 0, m.start()) > html.rfind('-->', 0, m.start()):
             continue
+        attrs = extract_attributes(m.group(0))
         if attrs.get('type') not in ('hidden', 'submit'):
             continue
         name = attrs.get('name') or attrs.get('id')
@@ -83,29 +117,43 @@ def html_hidden_inputs(html: str) -> Dict[str, str]:
     return hidden_inputs
 
 
+def json_dumps(obj: Any) -> str:
+    """Serialise to a compact JSON string, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+
 def extract_keys(keys: Sequence[Any], obj: Mapping[Any,
                                                    Any]) -> Mapping[Any, Any]:
-    new = {}
-    for key in keys:
-        new[key] = obj[key]
-    return new
-
-
-def path(s: str, obj: Any) -> Any:
-    for prop in s.split('.'):
-        if isinstance(obj, list):
-            try:
-                int_prop = int(prop)
-            except TypeError as e:
-                raise TypeError(
-                    'Property for a list must be an integer') from e
-            obj = obj[int_prop]
-        else:
-            obj = obj[prop]
-    return obj
+    if len(keys) == 1:
+        return {keys[0]: obj[keys[0]]}
+    return dict(zip(keys, itemgetter(*keys)(obj)))
+
 
+_PATH_CACHE: Dict[str, Tuple[Union[str, int], ...]] = {}
 
-def path_default(s: str, obj: Any, default: Any = None) -> Any:
+
+def _parse_path(s: str) -> Tuple[Union[str, int], ...]:
+    keys = _PATH_CACHE.get(s)
+    if keys is None:
+        keys = _PATH_CACHE.setdefault(
+            s,
+            tuple(
+                int(p) if p.lstrip('-').isdigit() else p
+                for p in s.split('.')))
+    return keys
+
+
+def path(s: Union[str, Sequence[Union[str, int]]], obj: Any) -> Any:
+    """Walk a dotted path (or a pre-parsed key sequence) into ``obj``."""
+    keys = _parse_path(s) if isinstance(s, str) else s
+    return reduce(getitem, keys, obj)
+
+
+def path_default(s: Union[str, Sequence[Union[str, int]]],
+                 obj: Any,
+                 default: Any = None) -> Any:
     try:
         return path(s, obj)
     except (IndexError, KeyError):
@@ -117,19 +165,12 @@ def get_text_runs(desc: DescriptionSnippetDict) -> str:
                    for x in desc['runs']).strip().replace('\n', ' - ')
 
 
-def context_client_body(
-    ytcfg: YtcfgDict
-) -> Mapping[str, Union[str, int, float, CountryLocationInfoDict]]:
-    assert 'INNERTUBE_CONTEXT_CLIENT_VERSION' in ytcfg
-    assert 'INNERTUBE_CONTEXT_GL' in ytcfg
-    assert 'INNERTUBE_CONTEXT_HL' in ytcfg
-    assert 'VISITOR_DATA' in ytcfg
-    return {
+_STATIC_CONTEXT_CLIENT_BODY: Mapping[str, Union[
+    str, int, float, CountryLocationInfoDict]] = {
         'browserName': 'Chrome',
         'browserVersion': '88.0.4324.96',
         'clientFormatFactor': 'UNKNOWN_FORM_FACTOR',
         'clientName': 'WEB',
-        'clientVersion': ytcfg['INNERTUBE_CONTEXT_CLIENT_VERSION'],
         'connectionType': 'CONN_WIFI',
         'countryLocationInfo': {
             'countryCode': 'US',
@@ -138,30 +179,40 @@ def context_client_body(
         'deviceMake': '',
         'deviceModel': '',
         'geo': 'US',
-        'gl': ytcfg['INNERTUBE_CONTEXT_GL'],
-        'hl': ytcfg['INNERTUBE_CONTEXT_HL'],
         'osName': 'X11',
         'platform': 'DESKTOP',
-        'screenDensityFloat': random.choice((1, 1.5, 2, 3)),
-        'screenHeightPoints': random.randrange(480, 7680),
-        'screenPixelDensity': random.choice((1, 2, 3)),
-        'screenWidthPoints': random.randrange(480, 7680),
         'timeZone': 'America/New_York',
         'userAgent': USER_AGENT,
         'userInterfaceTheme': 'USER_INTERFACE_THEME_DARK',
         'utcOffsetMinutes': -300,
+    }
+
+
+def context_client_body(
+    ytcfg: YtcfgDict
+) -> Mapping[str, Union[str, int, float, CountryLocationInfoDict]]:
+    assert 'INNERTUBE_CONTEXT_CLIENT_VERSION' in ytcfg
+    assert 'INNERTUBE_CONTEXT_GL' in ytcfg
+    assert 'INNERTUBE_CONTEXT_HL' in ytcfg
+    assert 'VISITOR_DATA' in ytcfg
+    return {
+        **_STATIC_CONTEXT_CLIENT_BODY,
+        'clientVersion': ytcfg['INNERTUBE_CONTEXT_CLIENT_VERSION'],
+        'gl': ytcfg['INNERTUBE_CONTEXT_GL'],
+        'hl': ytcfg['INNERTUBE_CONTEXT_HL'],
+        'screenDensityFloat': random.choice((1, 1.5, 2, 3)),
+        'screenHeightPoints': random.randrange(480, 7680),
+        'screenPixelDensity': random.choice((1, 2, 3)),
+        'screenWidthPoints': random.randrange(480, 7680),
         'visitorData': ytcfg['VISITOR_DATA'],
     }
 
 
 def first(it: Iterable[T]) -> T:
-    ret = None
-    for item in it:
-        ret = item
-        break
-    if not ret:
-        raise IndexError(0)
-    return ret
+    try:
+        return next(iter(it))
+    except StopIteration:
+        raise IndexError(0) from None
 
 
 def assert_not_none(x: Optional[T]) -> T:
@@ -1,4 +1,5 @@
-from typing import Dict, cast
+from functools import lru_cache
+from typing import Dict, Mapping, Union, cast
 import json
 import re
 
@@ -8,26 +9,66 @@ from .constants import WATCH_LATER_URL
 from .typing.ytcfg import YtcfgDict
 from .util import first
 
-__all__ = ('find_ytcfg', 'ytcfg_headers')
+__all__ = ('YTCFG_MARKER', 'find_ytcfg', 'find_ytcfg_in_html', 'parse_ytcfg',
+           'ytcfg_headers')
 
+YTCFG_MARKER = '"INNERTUBE_CONTEXT_CLIENT_VERSION":'
+_YTCFG_SET_RE = re.compile(r'.+ytcfg.set\(\{')
+_YTCFG_SET_PREFIX = 'ytcfg.set({'
 
-def find_ytcfg(soup: Soup) -> YtcfgDict:
+
+def parse_ytcfg(script_text: str) -> YtcfgDict:
+    """Parse the ytcfg JSON out of a single ``<script>`` body."""
     return cast(
         YtcfgDict,
         first(json.JSONDecoder().raw_decode(
-            re.sub(
-                r'.+ytcfg.set\(\{', '{',
-                first(x for x in soup.select('script')
-                      if '"INNERTUBE_CONTEXT_CLIENT_VERSION":' in
-                      x.text).text.strip().replace('\n', ''), 1))))
+            _YTCFG_SET_RE.sub('{',
+                              script_text.strip().replace('\n', ''), 1))))
 
 
-def ytcfg_headers(ytcfg: YtcfgDict) -> Dict[str, str]:
+def find_ytcfg_in_html(html: str) -> YtcfgDict:
+    """Find the ytcfg JSON in raw page text without building a DOM."""
+    decoder = json.JSONDecoder()
+    index = html.find(_YTCFG_SET_PREFIX)
+    while index != -1:
+        try:
+            candidate = decoder.raw_decode(
+                html,
+                index + len(_YTCFG_SET_PREFIX) - 1)[0]
+        except ValueError:
+            candidate = None
+        if (isinstance(candidate, dict)
+                and 'INNERTUBE_CONTEXT_CLIENT_VERSION' in candidate):
+            return cast(YtcfgDict, candidate)
+        index = html.find(_YTCFG_SET_PREFIX, index + 1)
+    raise IndexError(0)
+
+
+def find_ytcfg(page: Union[str, Soup]) -> YtcfgDict:
+    if isinstance(page, str):
+        return find_ytcfg_in_html(page)
+    return parse_ytcfg(
+        first(x.text for x in page.select('script')
+              if YTCFG_MARKER in x.text))
+
+
+@lru_cache(maxsize=16)
+def _ytcfg_headers(client_name: Union[str, int], client_version: str,
+                   page_cl: Union[str, int]) -> Mapping[str, str]:
     return {
         'x-spf-previous': WATCH_LATER_URL,
         'x-spf-referer': WATCH_LATER_URL,
-        'x-youtube-client-name': str(ytcfg['INNERTUBE_CONTEXT_CLIENT_NAME']),
-        'x-youtube-client-version': ytcfg['INNERTUBE_CONTEXT_CLIENT_VERSION'],
-        'x-youtube-page-cl': str(ytcfg['PAGE_CL']),
+        'x-youtube-client-name': str(client_name),
+        'x-youtube-client-version': client_version,
+        'x-youtube-page-cl': str(page_cl),
         'x-youtube-utc-offset': '-300',
     }
+
+
+def ytcfg_headers(ytcfg: YtcfgDict) -> Dict[str, str]:
+    # The ytcfg dict itself is not hashable, so memoise on the three
+    # fields actually used. Callers mutate the result, hence the copy
+    return dict(
+        _ytcfg_headers(ytcfg['INNERTUBE_CONTEXT_CLIENT_NAME'],
+                       ytcfg['INNERTUBE_CONTEXT_CLIENT_VERSION'],
+                       ytcfg['PAGE_CL']))